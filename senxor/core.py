@@ -224,11 +224,17 @@ class Senxor(SenxorHelperMixin):
         self._events.notify_stream_stopped()
         self._logger.info("stop_stream_success")
 
-    def refresh_all(self):
+    def refresh_all(self, *, batch: bool = False):
         """Refresh the all registers and fields. This method will read all registers and update all fields.
 
         Then use `self.regs.cache` and `self.fields.cache` to get the cached values you want.
 
+        Parameters
+        ----------
+        batch : bool, optional
+            If True, read all registers with a single `read_regs` call instead of one read per register.
+            This is much faster, but may cause the device to hang on some older firmware. Default is False.
+
         Examples
         --------
         >>> senxor.refresh_all()
@@ -238,7 +244,7 @@ class Senxor(SenxorHelperMixin):
         {"SW_RESET": 0, "DMA_TIMEOUT_ENABLE": 0, ...}
 
         """
-        self.regs.refresh_all()
+        self.regs.refresh_all(batch=batch)
 
     @overload
     def read(
@@ -412,6 +418,32 @@ class Senxor(SenxorHelperMixin):
             addr = reg
         self.regs.write_reg(addr, value)
 
+    def write_regs(self, regs: dict[int | RegisterName, int]):
+        """Write the values to multiple registers at once.
+
+        All registers are validated before anything is written, and the register and field caches
+        are refreshed once after the write.
+
+        Parameters
+        ----------
+        regs : dict[int | RegisterName, int]
+            The dictionary of registers and the values to write, specified by register name or integer address.
+
+        Raises
+        ------
+        AttributeError
+            If a register is not writable.
+
+        Examples
+        --------
+        >>> senxor.write_regs({"EMISSIVITY": 0x5F, 0xC2: 0x64})
+
+        """
+        regs_values = {
+            self.regs.get_reg(reg).address if isinstance(reg, str) else reg: value for reg, value in regs.items()
+        }
+        self.regs.write_regs(regs_values)
+
     def get_field(self, field: FieldName) -> int:
         """Get the value of a field.
 
@@ -441,6 +473,21 @@ class Senxor(SenxorHelperMixin):
         """
         return self.fields.set_field(field, value)
 
+    def set_fields(self, fields: dict[FieldName, int]):
+        """Set the values of multiple fields at once.
+
+        Parameters
+        ----------
+        fields : dict[FieldName, int]
+            The fields to set and the values to set them to.
+
+        Examples
+        --------
+        >>> senxor.set_fields({"CONTINUOUS_STREAM": 1, "NO_HEADER": 0})
+
+        """
+        return self.fields.set_fields(fields)
+
     def get_read_timeout(self) -> float:
         """Get the read timeout based on the frame rate divider."""
         fps_divider = self.fields.FRAME_RATE_DIVIDER.get()
@@ -4,9 +4,9 @@
 
 from __future__ import annotations
 
-import queue
 import threading
-from typing import TYPE_CHECKING, Callable, cast
+from collections import deque
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     import numpy as np
@@ -59,7 +59,7 @@ class CVCamThread:
         on_data: Callable[[np.ndarray], None] | None = None,
         *,
         raise_on_backlog: bool = False,
-        backlog_threshold: int = 5,
+        backlog_threshold: int | None = 5,
     ):
         """Thread for reading frames from a video capture.
 
@@ -71,8 +71,8 @@ class CVCamThread:
             The callback function to call when a frame is read.
         raise_on_backlog : bool, optional
             Whether to raise an error if the frame buffer backlog exceeds the threshold.
-        backlog_threshold : int, optional
-            The threshold for the frame buffer backlog.
+        backlog_threshold : int | None, optional
+            The threshold for the frame buffer backlog. If 0 or None, the backlog is unbounded.
 
         """
         self.video_capture = video_capture
@@ -80,14 +80,35 @@ class CVCamThread:
         self.notify_on_data = on_data is not None
         self.raise_on_backlog = raise_on_backlog
         self.backlog_threshold = backlog_threshold
-        self.last_data: np.ndarray | None = None
-
-        self._buffer = queue.Queue(maxsize=self.backlog_threshold)
+        # Single-slot holder of the latest frame. `append` replaces the frame and `popleft` takes it,
+        # both atomically, so a frame published while `read()` runs is never lost.
+        self._latest: deque[np.ndarray] = deque(maxlen=1)
+
+        # Appending to a full deque drops the oldest frame. The reader appends under `_data_ready` so the
+        # notifier can wait for frames, and the notifier pops them without the lock, as popleft is atomic.
+        maxlen = backlog_threshold if backlog_threshold and backlog_threshold > 0 else None
+        self._buffer: deque[np.ndarray] = deque(maxlen=maxlen)
+        self._data_ready = threading.Condition()
         self._stop_event = threading.Event()
         self._stop_event.set()
         self._reader_thread: threading.Thread | None = None
         self._notifier_thread: threading.Thread | None = None
 
+    @property
+    def last_data(self) -> np.ndarray | None:
+        """The latest frame that has not been taken by `read()` yet, or None."""
+        try:
+            return self._latest[-1]
+        except IndexError:
+            return None
+
+    @last_data.setter
+    def last_data(self, frame: np.ndarray | None) -> None:
+        if frame is None:
+            self._latest.clear()
+        else:
+            self._latest.append(frame)
+
     def start(self) -> None:
         self._stop_event.clear()
         self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
@@ -97,7 +118,7 @@ class CVCamThread:
             self._notifier_thread.start()
 
     def stop(self) -> None:
-        self._stop_event.set()
+        self._signal_stop()
         if self._reader_thread:
             self._reader_thread.join()
         if self._notifier_thread:
@@ -119,52 +140,63 @@ class CVCamThread:
         """
         if self._stop_event.is_set():
             raise RuntimeError("Thread not started. Call `start()` before reading data.")
-        if self.last_data is None:
-            frame = None
-        else:
-            frame = self.last_data
-            self.last_data = None
-        return frame
+        try:
+            return self._latest.popleft()
+        except IndexError:
+            return None
 
     def _read_loop(self) -> None:
-        while not self._stop_event.is_set():
+        capture_read = self.video_capture.read
+        publish = self._latest.append
+        put_data = self._put_data if self.notify_on_data else None
+        stop_is_set = self._stop_event.is_set
+        while not stop_is_set():
             try:
-                success, frame = self.video_capture.read()
+                success, frame = capture_read()
             except Exception:
-                self._stop_event.set()
+                self._signal_stop()
                 raise
             if not success:
                 continue
-            if self.notify_on_data:
-                self._put_data(frame)
-            self.last_data = frame
+            # Publish the frame to `read()` first, so it is never older than the one queued for `on_data`.
+            publish(frame)
+            if put_data is not None:
+                put_data(frame)
 
     def _put_data(self, frame: np.ndarray) -> None:
-        try:
-            self._buffer.put_nowait(frame)
-        except queue.Full:
-            if self.raise_on_backlog:
-                self._stop_event.set()
-                raise TimeoutError(
-                    "Frame buffer backlog exceeded. "
-                    "The callback function may be too slow or blocking. "
-                    "Consider optimizing the callback to handle frames more efficiently.",
-                ) from None
-            else:
-                self._buffer.get_nowait()
-                self._buffer.put_nowait(frame)
+        maxlen = self._buffer.maxlen
+        if self.raise_on_backlog and maxlen is not None and len(self._buffer) >= maxlen:
+            self._signal_stop()
+            raise TimeoutError(
+                "Frame buffer backlog exceeded. "
+                "The callback function may be too slow or blocking. "
+                "Consider optimizing the callback to handle frames more efficiently.",
+            )
+        with self._data_ready:
+            self._buffer.append(frame)
+            self._data_ready.notify()
 
     def _notify_loop(self) -> None:
-        while not self._stop_event.is_set():
-            frame = None
-            try:
-                frame = self._buffer.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            if frame is not None:
-                on_data = cast("Callable", self.on_data)
+        on_data = self.on_data
+        if on_data is None:
+            return
+        buffer = self._buffer
+        stop_is_set = self._stop_event.is_set
+        while True:
+            # Block until a frame arrives or the thread is stopped, without periodic wakeups.
+            with self._data_ready:
+                self._data_ready.wait_for(lambda: buffer or stop_is_set())
+            while buffer and not stop_is_set():
+                frame = buffer.popleft()
                 try:
                     on_data(frame)
                 except Exception:
-                    self._stop_event.set()
+                    self._signal_stop()
                     raise
+            if stop_is_set():
+                return
+
+    def _signal_stop(self) -> None:
+        self._stop_event.set()
+        with self._data_ready:
+            self._data_ready.notify_all()
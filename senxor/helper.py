@@ -250,12 +250,8 @@ class SenxorHelperMixin:
             The serial number as an integer.
 
         """
-        res = (
-            self.fields.SERIAL_NUMBER_0.get() << 16
-            | self.fields.SERIAL_NUMBER_1.get() << 8
-            | self.fields.SERIAL_NUMBER_2.get()
-        )
-        return res
+        # SERIAL_NUMBER_0 ~ SERIAL_NUMBER_2 live in SENXOR_ID_3 ~ SENXOR_ID_5 (0xE3 ~ 0xE5).
+        return int.from_bytes(self._get_senxor_id(0xE3, 0xE6), "big")
 
     def get_sn(self) -> str:
         """Get the SN code string in hex format.
@@ -274,11 +270,14 @@ class SenxorHelperMixin:
             The SN code string in hex format.
 
         """
-        production_year = self.fields.PRODUCTION_YEAR.get()
-        production_week = self.fields.PRODUCTION_WEEK.get()
-        manuf_location = self.fields.MANUF_LOCATION.get()
-        serial_number = self.get_serial_number()
-        return f"{production_year:02X}{production_week:02X}{manuf_location:02X}{serial_number:06X}"
+        # The SENXOR_ID registers hold the SN code bytes in this exact order.
+        return self._get_senxor_id(0xE0, 0xE6).hex().upper()
+
+    def _get_senxor_id(self, start: int, stop: int) -> bytes:
+        # SENXOR_ID_0 ~ SENXOR_ID_5 (0xE0 ~ 0xE5) are read-only and cached on open, so `get()` usually
+        # returns the cached value without reading the device. Only the registers in [start, stop) are read.
+        registers = self.regs.registers
+        return bytes(registers[addr].get() for addr in range(start, stop))
 
     def get_module_name(self) -> Literal["Cougar", "Panther", "Cheetah"]:
         """Get the module name.
@@ -14,6 +14,7 @@ from structlog.stdlib import BoundLogger
 __all__ = [
     "SenxorLogger",
     "get_logger",
+    "is_enabled_for",
     "setup_console_logger",
     "setup_file_logger",
     "setup_standard_logger",
@@ -64,6 +65,29 @@ def get_logger(logger_name: str = "senxor", *args, **kwargs) -> SenxorLogger:
     return logger
 
 
+def is_enabled_for(logger: SenxorLogger, level: int) -> bool:
+    """Check whether a logger would emit a message at the given level.
+
+    Use it to skip building expensive log arguments on hot paths. Both stdlib and
+    native structlog bound loggers are supported, other loggers are assumed enabled.
+
+    Parameters
+    ----------
+    logger : SenxorLogger
+        The structured logger instance.
+    level : int
+        The log level to check, e.g. `logging.INFO`.
+
+    Returns
+    -------
+    bool
+        Whether a message at `level` would be emitted.
+
+    """
+    check = getattr(logger, "isEnabledFor", None) or getattr(logger, "is_enabled_for", None)
+    return True if check is None else bool(check(level))
+
+
 def setup_standard_logger():
     """Setup a standard logger.
 
@@ -94,9 +118,7 @@ def setup_standard_logger():
         processors=formatter_processors,
     )
 
-    if senxor_logger.hasHandlers():
-        for handler_ in senxor_logger.handlers:
-            senxor_logger.removeHandler(handler_)
+    _clear_handlers(senxor_logger)
 
     handler = logging.StreamHandler()
     handler.setLevel(DEFAULT_LOGGER_LEVEL)
@@ -136,9 +158,7 @@ def setup_console_logger(log_level: int | str = "INFO", logger_name: str = "senx
     logger_level = min(logger_level, handler_level)
     logger.setLevel(logger_level)
 
-    if logger.hasHandlers():
-        for handler_ in logger.handlers:
-            logger.removeHandler(handler_)
+    _clear_handlers(logger)
 
     formatter = structlog.stdlib.ProcessorFormatter(
         processors=formatter_processors,
@@ -185,9 +205,7 @@ def setup_file_logger(
     logger_level = min(logger_level, handler_level)
     logger.setLevel(logger_level)
 
-    if logger.hasHandlers():
-        for handler_ in logger.handlers:
-            logger.removeHandler(handler_)
+    _clear_handlers(logger)
 
     file_path = Path(file_path)
 
@@ -216,6 +234,13 @@ def setup_file_logger(
     logger.propagate = False
 
 
+def _clear_handlers(logger: logging.Logger):
+    # Close the old handlers first, otherwise reconfiguring a file logger leaks its file descriptor.
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
+
 def _remove_logger_name_processor(_, __, event: dict):
     event.pop("logger", None)
     return event
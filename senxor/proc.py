@@ -13,6 +13,10 @@ import numpy as np
 
 from senxor.consts import KELVIN, SENXOR_FRAME_SHAPE
 
+# OpenCV is optional and slow to import, so it is only loaded by the first `enlarge` call.
+_CV2_NOT_LOADED: Any = object()
+cv2: Any = _CV2_NOT_LOADED
+
 __all__ = [
     "SenxorHeader",
     "apply_colormap",
@@ -43,6 +47,17 @@ ColormapKey = Literal[
     "viridis",
 ]
 
+# The dtypes supported by `cv2.resize`, used by `enlarge` to select the OpenCV fast path.
+_CV_RESIZE_DTYPES = frozenset(
+    np.dtype(t) for t in (np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64)
+)
+# The largest channel count accepted by cv2.resize, which is lower than `CV_CN_MAX` (512).
+_CV_MAX_CHANNELS = 128
+
+
+# `SENXOR_FRAME_SHAPE` keyed by the payload size in bytes (2 bytes per pixel).
+_FRAME_SHAPE_BY_NBYTES = {size * 2: shape for size, shape in SENXOR_FRAME_SHAPE.items()}
+
 
 class _LazyLutDict(Mapping):
     def __init__(self):
@@ -56,8 +71,22 @@ class _LazyLutDict(Mapping):
                 if path.is_file() and path.name.endswith(".npy")
             ],
         )
+        self._index = {key: i for i, key in enumerate(self._keys)}
+        # All LUTs live in one contiguous (num_maps, 256, 3) array, each row is filled on first access.
+        self._table = np.zeros((len(self._keys), 256, 3), dtype=np.uint8)
         self.data = {}
 
+    @property
+    def table(self) -> np.ndarray:
+        """The LUTs packed into a (num_maps, 256, 3) uint8 array, ordered as the keys."""
+        for key in self._keys:
+            self[key]
+        return self._table
+
+    def index(self, key: ColormapKey) -> int:
+        """Return the index of the LUT in `table`."""
+        return self._index[key]
+
     def _load_lut(self, key: str) -> np.ndarray:
         path = self.resource_path.joinpath(f"{key}.npy")
         try:
@@ -68,7 +97,12 @@ class _LazyLutDict(Mapping):
 
     def __getitem__(self, key: ColormapKey) -> np.ndarray:
         if key not in self.data:
-            self.data[key] = self._load_lut(key)
+            lut = self._load_lut(key)
+            idx = self._index.get(key)
+            if idx is not None and lut.shape == self._table.shape[1:]:
+                self._table[idx] = lut
+                lut = self._table[idx]
+            self.data[key] = lut
         return self.data[key]
 
     def __contains__(self, key: object) -> bool:
@@ -86,13 +120,16 @@ colormaps: dict[ColormapKey, np.ndarray] = _LazyLutDict()  # type: ignore[report
 
 def process_senxor_data(bytes_data: bytes, *, adc: bool = False) -> np.ndarray:
     """Process the senxor bytes data to a frame."""
-    data = np.frombuffer(bytes_data, dtype=np.uint16)
-    if not adc:
-        data = np.round(data / 10 - KELVIN, 1)
-    frame_shape = SENXOR_FRAME_SHAPE.get(data.shape[0], None)
+    # The payload size is fixed for a given module, so the shape is looked up by the byte length before any
+    # conversion, and the reshape is done on the uint16 view, which is free.
+    frame_shape = _FRAME_SHAPE_BY_NBYTES.get(len(bytes_data))
     if frame_shape is None:
-        raise ValueError(f"Unknown senxor data size: {data.shape[0]}, please report this issue to the developer.")
-    frame = data.reshape(frame_shape)
+        raise ValueError(
+            f"Unknown senxor data size: {len(bytes_data)} bytes, please report this issue to the developer.",
+        )
+    frame = np.frombuffer(bytes_data, dtype=np.uint16).reshape(frame_shape)
+    if not adc:
+        frame = np.round(frame / 10 - KELVIN, 1)
     return frame
 
 
@@ -233,6 +270,27 @@ def normalize(
     return normalized_image
 
 
+def _import_cv2() -> Any:
+    global cv2  # noqa: PLW0603
+    if cv2 is _CV2_NOT_LOADED:
+        try:
+            import cv2 as _cv2  # noqa: PLC0415
+        except ImportError:
+            _cv2 = None
+        cv2 = _cv2
+    return cv2
+
+
+def _can_cv_resize(cv: Any, image: np.ndarray) -> bool:
+    # `INTER_NEAREST_EXACT` is missing from older OpenCV releases. cv2.resize rejects empty images and
+    # more than 128 channels, and drops the channel axis of (H, W, 1) images. NumPy handles all of these.
+    if cv is None or not hasattr(cv, "INTER_NEAREST_EXACT"):
+        return False
+    if image.size == 0 or image.dtype not in _CV_RESIZE_DTYPES:
+        return False
+    return image.ndim == 2 or 1 < image.shape[2] <= _CV_MAX_CHANNELS
+
+
 def enlarge(image: np.ndarray, scale: int) -> np.ndarray:
     """Enlarge an image by an integer scale factor using nearest neighbor (no interpolation).
 
@@ -248,13 +306,21 @@ def enlarge(image: np.ndarray, scale: int) -> np.ndarray:
     np.ndarray
         Enlarged image array.
 
+    Notes
+    -----
+    If OpenCV is installed, `cv2.resize` with `INTER_NEAREST_EXACT` is used for the supported dtypes and
+    shapes, which is SIMD-accelerated and gives the same result as the NumPy fallback.
+
     """
     if scale < 1 or not isinstance(scale, int):
         raise ValueError("Scale must be an integer >= 1.")
-    if image.ndim == 2 or image.ndim == 3:
-        return image.repeat(scale, axis=0).repeat(scale, axis=1)
-    else:
+    if image.ndim != 2 and image.ndim != 3:
         raise ValueError("Input image must be 2D or 3D array.")
+    cv = _import_cv2()
+    if _can_cv_resize(cv, image):
+        height, width = image.shape[:2]
+        return cv.resize(image, (width * scale, height * scale), interpolation=cv.INTER_NEAREST_EXACT)
+    return image.repeat(scale, axis=0).repeat(scale, axis=1)
 
 
 def resample_lut(lut: np.ndarray, n: int) -> np.ndarray:
@@ -316,7 +382,7 @@ def resample_lut(lut: np.ndarray, n: int) -> np.ndarray:
 
 def apply_colormap(
     image: np.ndarray,
-    lut: np.ndarray,
+    lut: np.ndarray | ColormapKey,
     in_range: tuple | None = None,
     to_int: bool = True,
     resample_size: int = 256,
@@ -328,8 +394,9 @@ def apply_colormap(
     ----------
     image : np.ndarray
         The image to apply the colormap to. Should be a 2D array.
-    lut : np.ndarray
-        The colormap to apply. Should be a 2D array of shape (N, 3) or (N, 1, 3).
+    lut : np.ndarray | ColormapKey
+        The colormap to apply. Should be a 2D array of shape (N, 3) or (N, 1, 3),
+        or the name of a built-in colormap in `colormaps`.
     in_range : tuple | None, optional
         The input range of the image. If `None`, the image's min/max are used.
         providing (min, max) is recommended, because this can avoid re-computation.
@@ -358,12 +425,19 @@ def apply_colormap(
     >>> print(color_image.dtype)
     float32
 
+    >>> color_image = apply_colormap(image, "inferno")
+    >>> print(color_image.shape)
+    (2, 3, 3)
+
     """
     if not isinstance(resample_size, int) or resample_size < 256:
         raise ValueError("resample_size must be an integer >= 256 if specified.")
     if image.ndim != 2:
         raise ValueError("Input image must be a 2D array.")
 
+    if isinstance(lut, str):
+        lut = colormaps[lut]
+
     if lut.ndim == 3 and lut.shape[1] == 1 and lut.shape[2] == 3:
         lut = lut.reshape(-1, 3)
 
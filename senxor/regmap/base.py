@@ -139,14 +139,13 @@ class RegisterDescriptor(Generic[TRegister]):
     def __get__(self, instance: SenxorRegistersManager | None, owner):
         if instance is None:
             return self.cls
+        # This is a non-data descriptor: the registers manager stores its register instances in the
+        # instance `__dict__`, so `regmap.NAME` normally never reaches this method.
         try:
             return instance.get_reg(self.cls.name)  # type: ignore[reportArgumentType]
         except KeyError:
             raise AttributeError(f"Register '{self.cls.name}' not found in the register system") from None
 
-    def __set__(self, instance: SenxorRegistersManager, value: int) -> None:
-        raise AttributeError("Use '.set()' to set the value of a register")
-
 
 def describe(cls: type[TRegister]) -> RegisterDescriptor[TRegister]:
     return RegisterDescriptor[TRegister](cls)
@@ -199,10 +198,16 @@ class Field:
     unavailable_reason: str | None = None
     default_value: int | None = None
 
+    # Bit layout derived from ``bits_range`` by ``describe_field``, so that encoding and
+    # decoding a field value does not recompute the masks on every register access.
+    _shift: ClassVar[int]
+    _mask: ClassVar[int]
+    _reg_mask: ClassVar[int]
+    _max_value: ClassVar[int]
+
     def __init__(self, fieldmap: SenxorFieldsManager):
         self.fieldmap = fieldmap
         self._value: int | None = None
-        self._max_value = (1 << (self.bits_range[1] - self.bits_range[0])) - 1
 
     @property
     def value(self) -> int:
@@ -319,6 +324,7 @@ TField = TypeVar("TField", bound=Field)
 class FieldDescriptor(Generic[TField]):
     def __init__(self, cls: type[TField]):
         self.cls = cls
+        self.name = cls.name
 
     @overload
     @overload
@@ -328,15 +334,19 @@ class FieldDescriptor(Generic[TField]):
     def __get__(self, instance: SenxorFieldsManager | None, owner):
         if instance is None:
             return self.cls
+        # This is a non-data descriptor: the fields manager stores its field instances in the
+        # instance `__dict__`, so `fieldmap.NAME` normally never reaches this method.
         try:
-            return instance.get_field(self.cls.name)  # type: ignore[reportArgumentType]
+            return instance.fields[self.name]
         except KeyError:
             raise AttributeError(f"Field '{self.cls.name}' not found in the register system") from None
 
-    def __set__(self, instance: SenxorRegistersManager, value: int) -> None:
-        raise AttributeError("Use '.set()' to set the value of a field")
-
 
 def describe_field(cls: type[TField]) -> FieldDescriptor[TField]:
     cls.help = inspect.cleandoc(cls.help)
+    start, end = cls.bits_range
+    cls._shift = start
+    cls._mask = (1 << (end - start)) - 1
+    cls._reg_mask = cls._mask << start
+    cls._max_value = cls._mask
     return FieldDescriptor[TField](cls)
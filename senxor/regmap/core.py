@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, cast
 
-from senxor.log import get_logger
+from senxor.interface.protocol import ISenxorInterface
+from senxor.log import get_logger, is_enabled_for
 from senxor.regmap.fields import Fields
 from senxor.regmap.registers import Registers
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Collection, Iterable, Iterator
 
-    from senxor.interface.protocol import ISenxorInterface
     from senxor.regmap.base import Field, Register
     from senxor.regmap.types import FieldName, FieldsChangedCallback, RegisterAddress, RegisterName
 
@@ -69,6 +70,8 @@ class SenxorRegistersManager(Registers):
         self._registers_by_name: dict[RegisterName, Register] = {
             register.name: register for register in self.registers.values()
         }
+        # Bind the registers as instance attributes, `regmap.NAME` then skips the descriptor protocol.
+        self.__dict__.update(self._registers_by_name)
 
         self.fieldmap = SenxorFieldsManager(self)
 
@@ -85,8 +88,14 @@ class SenxorRegistersManager(Registers):
     def cache(self) -> dict[int, int | None]:
         return {addr: reg._value for addr, reg in self.registers.items()}
 
-    def refresh_all(self) -> None:
-        """Refresh the cache of all registers and fields."""
+    def refresh_all(self, *, batch: bool = False) -> None:
+        """Refresh the cache of all registers and fields.
+
+        If `batch` is True, all registers are read with a single `read_regs` call.
+        """
+        if batch:
+            self.read_regs(list(self.registers))
+            return
         for reg in self.registers.values():
             reg.read()
 
@@ -110,8 +119,9 @@ class SenxorRegistersManager(Registers):
             raise e
         else:
             self._update_reg_value(addr, value)
-            updated_fields = self.fieldmap._update_field_values({addr: value})
-            self._log.info("read_reg_success", op="read", addr=addr, value=value, updated_fields=updated_fields)
+            updated_fields = self.fieldmap._update_reg_field_values(addr, value)
+            if is_enabled_for(self._log, logging.INFO):
+                self._log.info("read_reg_success", op="read", addr=addr, value=value, updated_fields=updated_fields)
             return value
 
     def write_reg(self, addr: int, value: int) -> None:
@@ -126,21 +136,21 @@ class SenxorRegistersManager(Registers):
             raise e
         else:
             self._update_reg_value(addr, value)
-            updated_fields = self.fieldmap._update_field_values({addr: value})
-            self._log.info(
-                "write_reg_success",
-                op="write",
-                addr=addr,
-                value=value,
-                updated_fields=updated_fields,
-            )
+            updated_fields = self.fieldmap._update_reg_field_values(addr, value)
+            if is_enabled_for(self._log, logging.INFO):
+                self._log.info(
+                    "write_reg_success",
+                    op="write",
+                    addr=addr,
+                    value=value,
+                    updated_fields=updated_fields,
+                )
             self.fieldmap._warn_unavailable_fields(updated_fields)
 
     def read_regs(self, addrs: list[int]) -> dict[int, int]:
         """Read the values from multiple registers at once."""
-        for addr in addrs:
-            self._check_valid_addr(addr)
-            self._warn_unknown_reg(addr, "read_regs")
+        self._check_valid_addrs(addrs)
+        self._warn_unknown_regs(addrs, "read_regs")
         try:
             values = self.interface.read_regs(addrs)
         except Exception as e:
@@ -150,24 +160,68 @@ class SenxorRegistersManager(Registers):
             for addr, value in values.items():
                 self._update_reg_value(addr, value)
             fields_updated = self.fieldmap._update_field_values(values)
-            self._log.info("read_regs_success", op="read", values=values, fields_updated=fields_updated)
+            if is_enabled_for(self._log, logging.INFO):
+                self._log.info("read_regs_success", op="read", values=values, fields_updated=fields_updated)
             return values
 
     def write_regs(self, regs: dict[int, int]) -> None:
-        """Write the values to multiple registers at once."""
-        raise NotImplementedError
+        """Write the values to multiple registers at once.
+
+        If the interface does not implement `write_regs`, the registers are written one by one. If the write
+        fails, the cached values of all the registers are cleared, as some of them may have been written.
+        """
+        self._check_valid_addrs(regs)
+        for addr in regs:
+            self._check_reg_writable(addr)
+        self._warn_unknown_regs(regs, "write_regs")
+        try:
+            if type(self.interface).write_regs is ISenxorInterface.write_regs:
+                # `write_regs` is optional for interfaces, fall back to one write per register.
+                for addr, value in regs.items():
+                    self.interface.write_reg(addr, value)
+            else:
+                self.interface.write_regs(regs)
+        except Exception as e:
+            # Some registers may have been written before the failure, so their cached values are unknown.
+            self._invalidate_reg_values(regs)
+            self._log.exception("write_regs_failed", op="write", regs=regs, error=e)
+            raise e
+        else:
+            for addr, value in regs.items():
+                self._update_reg_value(addr, value)
+            updated_fields = self.fieldmap._update_field_values(regs)
+            if is_enabled_for(self._log, logging.INFO):
+                self._log.info("write_regs_success", op="write", regs=regs, updated_fields=updated_fields)
+            self.fieldmap._warn_unavailable_fields(updated_fields)
 
     def _update_reg_value(self, addr: int, value: int):
         reg = self.registers.get(addr)
         if reg:
             reg._update_value(value)
 
+    def _invalidate_reg_values(self, addrs: Iterable[int]) -> None:
+        for addr in addrs:
+            reg = self.registers.get(addr)
+            if reg:
+                reg._value = None
+            for field in self.fieldmap._fields_by_addr.get(addr, ()):
+                field._value = None
+
     def _check_valid_addr(self, addr: int):
         if not isinstance(addr, int):
             raise TypeError(f"Register address must be an integer, got {type(addr)}")
         if addr < 0 or addr > 0xFF:
             raise ValueError(f"Register address must be in [0, 0xFF], got {addr}")
 
+    def _check_valid_addrs(self, addrs: Collection[int]):
+        # Bulk variant of `_check_valid_addr`, the range is checked once with `min` and `max`.
+        for addr in addrs:
+            if not isinstance(addr, int):
+                raise TypeError(f"Register address must be an integer, got {type(addr)}")
+        if addrs and (min(addrs) < 0 or max(addrs) > 0xFF):
+            invalid = [addr for addr in addrs if addr < 0 or addr > 0xFF]
+            raise ValueError(f"Register address must be in [0, 0xFF], got {invalid}")
+
     def _check_reg_writable(self, addr: int):
         reg = self.registers.get(addr)
         if reg and not reg.writable:
@@ -180,6 +234,12 @@ class SenxorRegistersManager(Registers):
             return True
         return False
 
+    def _warn_unknown_regs(self, addrs: Collection[int], op: str):
+        known = Registers.__addrs__
+        for addr in addrs:
+            if addr not in known:
+                self._log.warning("access_unknown_reg", op=op, addr=addr)
+
 
 class SenxorFieldsManager(Fields):
     """The field system for the senxor.
@@ -222,6 +282,11 @@ class SenxorFieldsManager(Fields):
         self._log = regmap._log
         self.regmap: SenxorRegistersManager = regmap
         self.fields: dict[str, Field] = {field.name: field(self) for field in self.__fields__}
+        # Bind the fields as instance attributes, `fieldmap.NAME` then skips the descriptor protocol.
+        self.__dict__.update(self.fields)
+        self._fields_by_addr: dict[int, tuple[Field, ...]] = {
+            addr: tuple(self.fields[name] for name in names) for addr, names in self.__reg2fields__.items()
+        }
         self._fields_changed_callback: FieldsChangedCallback | None = None
 
     def set_fields_changed_callback(self, callback: FieldsChangedCallback | None) -> None:
@@ -253,17 +318,29 @@ class SenxorFieldsManager(Fields):
 
     def get_fields_by_addr(self, addr: RegisterAddress) -> list[Field]:
         """Get the fields by register address."""
-        names = self.__reg2fields__[addr]
-        return [self.fields[name] for name in names]
+        return list(self._fields_by_addr[addr])
 
     def read_field(self, name: FieldName) -> int:
         """Read a field value from the senxor."""
         field = self.get_field(name)
-        reg = self.regmap.get_reg(field.address)
-        reg_value = reg.read()
-        field_value = self._decode_field_value(reg_value, field.bits_range)
-        field._update_value(field_value)
-        return field_value
+        # Every field lives in a single register, and reading it refreshes all of its fields.
+        self.regmap.read_reg(field.address)
+        return cast("int", field._value)
+
+    def read_fields(self, names: Iterable[FieldName], *, batch: bool = False) -> dict[FieldName, int]:
+        """Read multiple field values from the senxor at once.
+
+        Each register holding the fields is read once. If `batch` is True, the registers are read with a
+        single `read_regs` call, which is faster but may cause the device to hang on some older firmware.
+        """
+        fields = [self.get_field(name) for name in names]
+        addrs = list(dict.fromkeys(field.address for field in fields))
+        if batch:
+            self.regmap.read_regs(addrs)
+        else:
+            for addr in addrs:
+                self.regmap.read_reg(addr)
+        return {field.name: cast("int", field._value) for field in fields}
 
     def set_field(self, name: FieldName, value: int, *, force: bool = False) -> None:
         """Set a field value on the senxor."""
@@ -272,31 +349,81 @@ class SenxorFieldsManager(Fields):
         self._check_field_writable(field)
         self._check_field_value_range(field, value)
         self._validate_field_value(field, value)
-        reg = self.regmap.get_reg(field.address)
-
-        reg_value = reg.get()
-        new_reg_value = self._encode_field_value(reg_value, value, field.bits_range)
-        self.regmap.write_reg(reg.address, new_reg_value)
+        if field._reg_mask == 0xFF:
+            # The field spans the whole register, so there are no other bits to preserve.
+            new_reg_value = value
+        else:
+            reg_value = self.regmap.get_reg(field.address).get()
+            new_reg_value = (reg_value & ~field._reg_mask) | (value << field._shift)
+        self.regmap.write_reg(field.address, new_reg_value)
         field._update_value(value)
-        self._log.info("set_field_success", name=field.name, value=value)
+        if is_enabled_for(self._log, logging.INFO):
+            self._log.info("set_field_success", name=field.name, value=value)
+
+    def set_fields(self, values: dict[FieldName, int], *, force: bool = False) -> None:
+        """Set multiple field values on the senxor at once.
+
+        Fields sharing a register are merged, so each register is written once.
+        """
+        not_writable = values.keys() - self.__writable__
+        if not_writable:
+            # Unknown names raise KeyError, like `get_field`.
+            names = sorted(self.get_field(name).name for name in not_writable)
+            self._log.critical("field_read_only_violation", names=names)
+            raise AttributeError(f"Fields {names} are read-only")
+
+        masks: dict[int, int] = {}
+        updates: dict[int, int] = {}
+        fields: list[tuple[Field, int]] = []
+        for name, value in values.items():
+            field = self.get_field(name)
+            self._check_field_available(field, force)
+            self._check_field_value_range(field, value)
+            self._validate_field_value(field, value)
+            masks[field.address] = masks.get(field.address, 0) | field._reg_mask
+            updates[field.address] = (updates.get(field.address, 0) & ~field._reg_mask) | (value << field._shift)
+            fields.append((field, value))
+
+        # Preserve the bits of the fields that are not being set. Registers with a valid cached value
+        # are used as is, the others are read one by one, as bulk reads may hang older firmware.
+        registers = self.regmap.registers
+        for addr, mask in masks.items():
+            if mask != 0xFF:
+                updates[addr] |= registers[addr].get() & ~mask
+
+        self.regmap.write_regs(updates)
+        for field, value in fields:
+            field._update_value(value)
+        if is_enabled_for(self._log, logging.INFO):
+            self._log.info("set_fields_success", values=values)
 
     def _update_field_values(self, regs: dict[int, int]) -> dict[str, int]:
         updated_fields: dict[str, int] = {}
         for addr, reg_value in regs.items():
-            if addr not in self.regmap.registers:
-                continue
-            fields = self.get_fields_by_addr(cast("RegisterAddress", addr))
-            for field in fields:
-                field_value = self._decode_field_value(reg_value, field.bits_range)
-                if field_value != field._value:
-                    updated_fields[field.name] = field_value
-                    field._update_value(field_value)
+            self._decode_reg_fields(addr, reg_value, updated_fields)
 
         if updated_fields and self._fields_changed_callback is not None:
             self._fields_changed_callback(updated_fields)
 
         return updated_fields
 
+    def _update_reg_field_values(self, addr: int, reg_value: int) -> dict[str, int]:
+        # Single register variant of `_update_field_values` for `read_reg` and `write_reg`.
+        updated_fields: dict[str, int] = {}
+        self._decode_reg_fields(addr, reg_value, updated_fields)
+
+        if updated_fields and self._fields_changed_callback is not None:
+            self._fields_changed_callback(updated_fields)
+
+        return updated_fields
+
+    def _decode_reg_fields(self, addr: int, reg_value: int, updated_fields: dict[str, int]) -> None:
+        for field in self._fields_by_addr.get(addr, ()):
+            field_value = (reg_value >> field._shift) & field._mask
+            if field_value != field._value:
+                updated_fields[field.name] = field_value
+                field._update_value(field_value)
+
     def _warn_unavailable_fields(self, fields: dict[str, int]) -> None:
         for name, value in fields.items():
             field = self.fields[name]
@@ -331,20 +458,3 @@ class SenxorFieldsManager(Fields):
         if not field.writable:
             self._log.critical("field_read_only_violation", name=field.name)
             raise AttributeError(f"Field {field.name} is read-only")
-
-    @staticmethod
-    def _decode_field_value(reg_value: int, bits_range: tuple[int, int]) -> int:
-        start, end = bits_range
-        length = end - start
-        mask = (1 << length) - 1
-        result = (reg_value >> start) & mask
-        return result
-
-    @staticmethod
-    def _encode_field_value(reg_value: int, field_value: int, bits_range: tuple[int, int]) -> int:
-        start, end = bits_range
-        length = end - start
-        max_value = (1 << length) - 1
-        mask = max_value << start
-        result = (reg_value & ~mask) | ((field_value & max_value) << start)
-        return result
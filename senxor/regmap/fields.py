@@ -9,6 +9,27 @@ from senxor.consts import SENXOR_TYPE as SENXOR_TYPE_MAP
 from senxor.regmap.base import Field, FieldDescriptor, describe_field
 from senxor.regmap.registers import Registers
 
+# Display formulas of the fields that precompute their display values. They are also used as the fallback
+# for values outside of the precomputed tables.
+
+
+def _frame_rate_divider_display(value: int) -> str:
+    return "MAX FPS" if value == 0 else f"1/{value} MAX FPS"
+
+
+def _sleep_period_display(value: int, period_x100: int) -> str:
+    return f"{value} s" if period_x100 == 1 else f"{value * 10} ms"
+
+
+def _offset_display(value: int) -> float:
+    int8 = value if value < 128 else value - 256
+    return round(int8 * 0.1, 1)
+
+
+def _otf_display(value: int) -> float:
+    int8 = value if value < 128 else value - 256
+    return round(1 + int8 * 0.01, 2)
+
 
 class Fields:
     """The definition of the fields for the senxor.
@@ -21,6 +42,8 @@ class Fields:
         The list of field definitions.
     __reg2fields__ : dict[int, list[str]]
         The dictionary of register addresses to field names.
+    __writable__ : frozenset[str]
+        The names of the writable fields.
 
     Examples
     --------
@@ -37,10 +60,16 @@ class Fields:
 
     __fields__: ClassVar[list[type[Field]]] = []
     __reg2fields__: ClassVar[dict[int, list[str]]] = {}
+    __writable__: ClassVar[frozenset[str]] = frozenset()
 
     def __init__(self):
         raise RuntimeError("Do not instantiate this class directly.")
 
+    def __setattr__(self, name: str, value: object) -> None:
+        if isinstance(Fields.__dict__.get(name), FieldDescriptor):
+            raise AttributeError("Use '.set()' to set the value of a field")
+        super().__setattr__(name, value)
+
     @describe_field
     class SW_RESET(Field):
         name = "SW_RESET"
@@ -103,7 +132,8 @@ class Fields:
         }
 
         def get_display(self, value: int) -> str:
-            return self.value_map.get(value, f"Invalid value: {value}")
+            display = self.value_map.get(value)
+            return f"Invalid value: {value}" if display is None else display
 
     @describe_field
     class STOP_HOST_XFER(Field):
@@ -220,7 +250,8 @@ class Fields:
         }
 
         def get_display(self, value: int) -> str:
-            return self.value_map.get(value, f"Invalid value: {value}")
+            display = self.value_map.get(value)
+            return f"Invalid value: {value}" if display is None else display
 
     @describe_field
     class NO_HEADER(Field):
@@ -320,11 +351,13 @@ class Fields:
         self_reset = False
         available = True
 
+        # The field is 7 bits wide, so every display string is precomputed.
+        _display_table: ClassVar[tuple[str, ...]] = tuple(_frame_rate_divider_display(value) for value in range(128))
+
         def get_display(self, value: int) -> str:
-            if value == 0:
-                return "MAX FPS"
-            else:
-                return f"1/{value} MAX FPS"
+            if 0 <= value < 128:
+                return self._display_table[value]
+            return _frame_rate_divider_display(value)
 
     @describe_field
     class SLEEP_PERIOD(Field):
@@ -343,12 +376,17 @@ class Fields:
         self_reset = False
         available = True
 
+        # Display strings of the 6-bit field, indexed by [PERIOD_X100][value].
+        _display_table: ClassVar[tuple[tuple[str, ...], tuple[str, ...]]] = (
+            tuple(_sleep_period_display(value, 0) for value in range(64)),
+            tuple(_sleep_period_display(value, 1) for value in range(64)),
+        )
+
         def get_display(self, value: int) -> str:
             period_x100 = self.fieldmap.PERIOD_X100.get()
-            if period_x100 == 1:
-                return f"{value} s"
-            else:
-                return f"{value * 10} ms"
+            if 0 <= value < 64 and 0 <= period_x100 <= 1:
+                return self._display_table[period_x100][value]
+            return _sleep_period_display(value, period_x100)
 
     @describe_field
     class PERIOD_X100(Field):
@@ -532,7 +570,8 @@ class Fields:
         }
 
         def get_display(self, value: int) -> str:
-            return self.value_map.get(value, f"Invalid value: {value}")
+            display = self.value_map.get(value)
+            return f"Invalid value: {value}" if display is None else display
 
     @describe_field
     class SENXOR_TYPE(Field):
@@ -549,7 +588,8 @@ class Fields:
         available = True
 
         def get_display(self, value: int) -> str:
-            return SENXOR_TYPE_MAP.get(value, f"Unknown: {value}")
+            display = SENXOR_TYPE_MAP.get(value)
+            return f"Unknown: {value}" if display is None else display
 
     @describe_field
     class MODULE_TYPE(Field):
@@ -568,7 +608,8 @@ class Fields:
         available = True
 
         def get_display(self, value: int) -> str:
-            return MODULE_TYPE_MAP.get(value, f"Unknown: {value}")
+            display = MODULE_TYPE_MAP.get(value)
+            return f"Unknown: {value}" if display is None else display
 
     @describe_field
     class MCU_TYPE(Field):
@@ -585,7 +626,8 @@ class Fields:
         available = True
 
         def get_display(self, value: int) -> str:
-            return MCU_TYPE_MAP.get(value, f"Unknown: {value}")
+            display = MCU_TYPE_MAP.get(value)
+            return f"Unknown: {value}" if display is None else display
 
     @describe_field
     class LUT_SOURCE(Field):
@@ -611,7 +653,8 @@ class Fields:
         }
 
         def get_display(self, value: int) -> str:
-            return self.value_map.get(value, f"Invalid value: {value}")
+            display = self.value_map.get(value)
+            return f"Invalid value: {value}" if display is None else display
 
     @describe_field
     class LUT_SELECTOR(Field):
@@ -789,10 +832,13 @@ class Fields:
         self_reset = False
         available = True
 
+        # The field is 8 bits wide, so every display value is precomputed from its int8 reading.
+        _display_table: ClassVar[tuple[float, ...]] = tuple(_offset_display(uint8) for uint8 in range(256))
+
         def get_display(self, value: int) -> float:
-            uint8 = value
-            int8 = uint8 if uint8 < 128 else uint8 - 256
-            return round(int8 * 0.1, 1)
+            if 0 <= value < 256:
+                return self._display_table[value]
+            return _offset_display(value)
 
     @describe_field
     class OTF(Field):
@@ -820,10 +866,13 @@ class Fields:
         self_reset = False
         available = True
 
+        # The field is 8 bits wide, so every display value is precomputed from its int8 reading.
+        _display_table: ClassVar[tuple[float, ...]] = tuple(_otf_display(uint8) for uint8 in range(256))
+
         def get_display(self, value: int) -> float:
-            uint8 = value
-            int8 = uint8 if uint8 < 128 else uint8 - 256
-            return round(1 + int8 * 0.01, 2)
+            if 0 <= value < 256:
+                return self._display_table[value]
+            return _otf_display(value)
 
     @describe_field
     class PRODUCTION_YEAR(Field):
@@ -968,7 +1017,8 @@ class Fields:
         }
 
         def get_display(self, value: int) -> str:
-            return self.value_map.get(value, f"Invalid value: {value}")
+            display = self.value_map.get(value)
+            return f"Invalid value: {value}" if display is None else display
 
     @describe_field
     class STARK_ENABLE(Field):
@@ -1022,7 +1072,8 @@ class Fields:
         }
 
         def get_display(self, value: int) -> str:
-            return self.value_map.get(value, f"Invalid value: {value}")
+            display = self.value_map.get(value)
+            return f"Invalid value: {value}" if display is None else display
 
     @describe_field
     class SPATIAL_KERNEL(Field):
@@ -1048,7 +1099,8 @@ class Fields:
         }
 
         def get_display(self, value: int) -> str:
-            return self.value_map.get(value, f"Invalid value: {value}")
+            display = self.value_map.get(value)
+            return f"Invalid value: {value}" if display is None else display
 
     @describe_field
     class STARK_CUTOFF(Field):
@@ -1181,7 +1233,8 @@ class Fields:
         }
 
         def get_display(self, value: int) -> str:
-            return self.value_map.get(value, f"Invalid value: {value}")
+            display = self.value_map.get(value)
+            return f"Invalid value: {value}" if display is None else display
 
     @describe_field
     class TEMPORAL_ENABLE(Field):
@@ -1255,6 +1308,7 @@ Fields.__fields__ = [v.cls for v in Fields.__dict__.values() if isinstance(v, Fi
 Fields.__reg2fields__ = {addr: [] for addr in Registers.__addrs__}
 for field in Fields.__fields__:
     Fields.__reg2fields__[field.address].append(field.name)
+Fields.__writable__ = frozenset(field.name for field in Fields.__fields__ if field.writable)
 
 if __name__ == "__main__":
     print(Fields.__reg2fields__)
@@ -50,6 +50,11 @@ class Registers:
     def __init__(self):
         raise RuntimeError("Do not instantiate this class directly.")
 
+    def __setattr__(self, name: str, value: object) -> None:
+        if isinstance(Registers.__dict__.get(name), RegisterDescriptor):
+            raise AttributeError("Use '.set()' to set the value of a register")
+        super().__setattr__(name, value)
+
     @describe
     class MCU_RESET(Register):
         name = "MCU_RESET"
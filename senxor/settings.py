@@ -32,6 +32,8 @@ class SenxorSettings(BaseSettings):
 
     @classmethod
     def _apply_profile(cls, obj: Senxor, settings: dict[str, int]) -> None:
+        # Settings are applied one key at a time, in profile order, so a raw `REG_` setting always lands
+        # after the field settings listed before it, and a failure is reported with its key.
         for key, value in settings.items():
             try:
                 if key.startswith("REG_"):
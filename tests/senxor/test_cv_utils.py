@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from senxor.cv_utils import CVCamThread
+
+
+class FakeVideoCapture:
+    def __init__(self, n_frames: int | None = None):
+        self.n_frames = n_frames
+        self.count = 0
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        if self.n_frames is not None and self.count >= self.n_frames:
+            return False, None
+        self.count += 1
+        return True, np.full((2, 2), self.count, dtype=np.uint8)
+
+
+def _make_thread(capture: FakeVideoCapture, *args, **kwargs) -> CVCamThread:
+    return CVCamThread(capture, *args, **kwargs)  # type: ignore[reportArgumentType]
+
+
+class TestCVCamThread:
+    def test_read_without_start(self):
+        thread = _make_thread(FakeVideoCapture())
+        with pytest.raises(RuntimeError):
+            thread.read()
+
+    def test_read_takes_latest_frame_once(self):
+        thread = _make_thread(FakeVideoCapture())
+        thread._stop_event.clear()
+        assert thread.read() is None
+        thread._latest.append(np.zeros(1))
+        thread._latest.append(np.ones(1))
+        assert thread.last_data is not None
+        frame = thread.read()
+        assert frame is not None
+        assert frame[0] == 1
+        assert thread.read() is None
+        assert thread.last_data is None
+
+    def test_last_data_setter(self):
+        thread = _make_thread(FakeVideoCapture())
+        thread._stop_event.clear()
+        thread.last_data = np.ones(1)
+        frame = thread.read()
+        assert frame is not None
+        assert frame[0] == 1
+        thread.last_data = np.ones(1)
+        thread.last_data = None
+        assert thread.last_data is None
+        assert thread.read() is None
+
+    def test_on_data_receives_frames_in_order(self):
+        received: list[int] = []
+        done = threading.Event()
+
+        def on_data(frame: np.ndarray) -> None:
+            received.append(int(frame[0, 0]))
+            if len(received) == 3:
+                done.set()
+
+        thread = _make_thread(FakeVideoCapture(n_frames=3), on_data, backlog_threshold=5)
+        thread.start()
+        assert done.wait(timeout=2)
+        thread.stop()
+        assert received == [1, 2, 3]
+
+    def test_latest_frame_published_before_on_data(self):
+        stale: list[int] = []
+        done = threading.Event()
+
+        def on_data(frame: np.ndarray) -> None:
+            latest = thread.last_data
+            if latest is None or latest[0, 0] < frame[0, 0]:
+                stale.append(int(frame[0, 0]))
+            if frame[0, 0] == 3:
+                done.set()
+
+        thread = _make_thread(FakeVideoCapture(n_frames=3), on_data, backlog_threshold=5)
+        thread.start()
+        assert done.wait(timeout=2)
+        thread.stop()
+        assert stale == []
+
+    def test_stop_wakes_idle_notifier(self):
+        thread = _make_thread(FakeVideoCapture(n_frames=0), lambda _: None)
+        thread.start()
+        stopper = threading.Thread(target=thread.stop, daemon=True)
+        stopper.start()
+        stopper.join(timeout=2)
+        assert not stopper.is_alive()
+
+    def test_backlog_drops_oldest_frames(self):
+        thread = _make_thread(FakeVideoCapture(), lambda _: None, backlog_threshold=2)
+        for i in range(4):
+            thread._put_data(np.full((1,), i))
+        assert [int(frame[0]) for frame in thread._buffer] == [2, 3]
+
+    def test_backlog_raises(self):
+        thread = _make_thread(FakeVideoCapture(), lambda _: None, raise_on_backlog=True, backlog_threshold=2)
+        thread._put_data(np.zeros(1))
+        thread._put_data(np.zeros(1))
+        with pytest.raises(TimeoutError):
+            thread._put_data(np.zeros(1))
+
+    @pytest.mark.parametrize("backlog_threshold", [0, None])
+    def test_backlog_unbounded(self, backlog_threshold: int | None):
+        thread = _make_thread(
+            FakeVideoCapture(),
+            lambda _: None,
+            raise_on_backlog=True,
+            backlog_threshold=backlog_threshold,
+        )
+        for i in range(10):
+            thread._put_data(np.full((1,), i))
+        assert [int(frame[0]) for frame in thread._buffer] == list(range(10))
@@ -0,0 +1,37 @@
+import pytest
+
+from senxor.core import Senxor
+from tests.senxor.conftest import MockDevice, MockInterface
+
+
+class TestSenxorId:
+    def test_serial_number_and_sn(self):
+        interface = MockInterface(MockDevice())  # pyright: ignore[reportAbstractUsage]
+        interface.values.update({0xE0: 0x19, 0xE1: 0x2A, 0xE2: 0x03, 0xE3: 0x01, 0xE4: 0x02, 0xE5: 0xFE})
+        senxor = Senxor(interface, auto_open=False)
+
+        assert senxor.get_serial_number() == 0x0102FE
+        assert senxor.get_sn() == "192A030102FE"
+        assert senxor.fields.SERIAL_NUMBER_2._value == 0xFE
+
+    def test_senxor_id_is_read_once(self, monkeypatch: pytest.MonkeyPatch):
+        interface = MockInterface(MockDevice())  # pyright: ignore[reportAbstractUsage]
+        senxor = Senxor(interface, auto_open=False)
+        reads: list[int] = []
+        read_reg = interface.read_reg
+
+        def tracking_read_reg(reg: int) -> int:
+            reads.append(reg)
+            return read_reg(reg)
+
+        def fail_read_regs(regs: list[int]) -> dict[int, int]:
+            raise AssertionError(f"Unexpected bulk read of registers {regs}")
+
+        monkeypatch.setattr(interface, "read_reg", tracking_read_reg)
+        monkeypatch.setattr(interface, "read_regs", fail_read_regs)
+        # The serial number only needs SENXOR_ID_3 ~ SENXOR_ID_5
+        senxor.get_serial_number()
+        assert reads == [0xE3, 0xE4, 0xE5]
+        senxor.get_sn()
+        senxor.get_serial_number()
+        assert reads == [0xE3, 0xE4, 0xE5, 0xE0, 0xE1, 0xE2]
@@ -0,0 +1,46 @@
+import logging
+
+import structlog
+
+from senxor.log import is_enabled_for, setup_console_logger, setup_file_logger
+
+
+class TestSetupLogger:
+    def test_all_old_handlers_are_removed(self):
+        logger = logging.getLogger("senxor_test_remove_handlers")
+        for _ in range(3):
+            logger.addHandler(logging.NullHandler())
+
+        setup_console_logger(logger_name=logger.name)
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.StreamHandler)
+
+    def test_reconfigure_closes_file_handler(self, tmp_path):
+        logger = logging.getLogger("senxor_test_close_handlers")
+        setup_file_logger(tmp_path / "first.log", logger_name=logger.name)
+        first_handler = logger.handlers[0]
+        assert isinstance(first_handler, logging.FileHandler)
+
+        setup_file_logger(tmp_path / "second.log", logger_name=logger.name)
+        assert logger.handlers == [logger.handlers[0]]
+        assert logger.handlers[0] is not first_handler
+        assert first_handler.stream is None
+
+        setup_console_logger(logger_name=logger.name)
+
+
+class TestIsEnabledFor:
+    def test_stdlib_logger(self):
+        std_logger = logging.getLogger("senxor_test_is_enabled_for")
+        std_logger.setLevel(logging.WARNING)
+        logger = structlog.stdlib.BoundLogger(std_logger, [], {})
+        assert is_enabled_for(logger, logging.WARNING) is True
+        assert is_enabled_for(logger, logging.INFO) is False
+
+    def test_native_logger(self):
+        logger = structlog.wrap_logger(None, wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+        assert is_enabled_for(logger, logging.WARNING) is True
+        assert is_enabled_for(logger, logging.INFO) is False
+
+    def test_unknown_logger_is_enabled(self):
+        assert is_enabled_for(object(), logging.DEBUG) is True  # type: ignore[reportArgumentType]
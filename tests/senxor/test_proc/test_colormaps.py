@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from senxor.proc import colormaps
+from senxor.proc import apply_colormap, colormaps
 
 
 class TestLazyLutDictInterface:
@@ -66,3 +66,25 @@ class TestMappingContract:
             assert lut.shape[1] == 3
             values_count += 1
         assert values_count == len(colormaps)
+
+
+class TestPackedTable:
+    def test_table_layout(self):
+        fresh_dict = type(colormaps)()
+        table = fresh_dict.table  # type: ignore[reportAttributeIssue]
+        assert table.shape == (len(fresh_dict), 256, 3)
+        assert table.dtype == np.uint8
+        assert table.flags["C_CONTIGUOUS"]
+
+    def test_values_are_table_views(self):
+        fresh_dict = type(colormaps)()
+        for key in fresh_dict:
+            lut = fresh_dict[key]
+            idx = fresh_dict.index(key)  # type: ignore[reportAttributeIssue]
+            assert np.shares_memory(lut, fresh_dict.table)  # type: ignore[reportAttributeIssue]
+            np.testing.assert_array_equal(fresh_dict.table[idx], lut)  # type: ignore[reportAttributeIssue]
+            np.testing.assert_array_equal(lut, fresh_dict._load_lut(key))  # type: ignore[reportAttributeIssue]
+
+    def test_apply_colormap_by_name(self):
+        image = np.array([[0, 100, 200], [50, 150, 255]], dtype=np.uint8)
+        np.testing.assert_array_equal(apply_colormap(image, "inferno"), apply_colormap(image, colormaps["inferno"]))
@@ -0,0 +1,75 @@
+import importlib
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from senxor import proc
+from senxor.proc import enlarge
+
+
+def _reference(image: np.ndarray, scale: int) -> np.ndarray:
+    return image.repeat(scale, axis=0).repeat(scale, axis=1)
+
+
+@pytest.fixture(params=["cv2", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "cv2":
+        pytest.importorskip("cv2")
+    else:
+        monkeypatch.setattr(proc, "cv2", None)
+    return request.param
+
+
+class TestEnlarge:
+    @pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32, np.float64, np.int64])
+    @pytest.mark.parametrize("shape", [(62, 80), (62, 80, 3), (50, 50, 1), (120, 160, 4)])
+    @pytest.mark.parametrize("scale", [1, 3, 4])
+    def test_matches_repeat(self, backend, dtype, shape, scale):  # noqa: ARG002
+        rng = np.random.default_rng(0)
+        image = (rng.random(shape) * 200).astype(dtype)
+        result = enlarge(image, scale)
+        assert result.dtype == image.dtype
+        np.testing.assert_array_equal(result, _reference(image, scale))
+
+    def test_non_contiguous_input(self, backend):  # noqa: ARG002
+        image = np.arange(100 * 100, dtype=np.float32).reshape(100, 100)[10:50:2, 5:70]
+        np.testing.assert_array_equal(enlarge(image, 2), _reference(image, 2))
+
+    def test_empty_image(self, backend):  # noqa: ARG002
+        image = np.zeros((0, 5), dtype=np.uint8)
+        result = enlarge(image, 2)
+        assert result.shape == (0, 10)
+        assert result.dtype == image.dtype
+
+    @pytest.mark.parametrize("channels", [128, 129, 512, 600])
+    def test_many_channels(self, backend, channels):  # noqa: ARG002
+        image = (np.arange(2 * 2 * channels) % 256).astype(np.uint8).reshape(2, 2, channels)
+        np.testing.assert_array_equal(enlarge(image, 2), _reference(image, 2))
+
+    def test_invalid_args(self, backend):  # noqa: ARG002
+        image = np.zeros((4, 4), dtype=np.uint8)
+        with pytest.raises(ValueError, match="Scale"):
+            enlarge(image, 0)
+        with pytest.raises(ValueError, match="Scale"):
+            enlarge(image, 2.0)  # type: ignore[reportArgumentType]
+        with pytest.raises(ValueError, match="2D or 3D"):
+            enlarge(np.zeros(4, dtype=np.uint8), 2)
+
+
+def test_cv2_without_inter_nearest_exact(monkeypatch):
+    def resize(*_args, **_kwargs):
+        raise AssertionError("cv2.resize should not be used")
+
+    monkeypatch.setattr(proc, "cv2", SimpleNamespace(resize=resize))
+    image = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    np.testing.assert_array_equal(enlarge(image, 2), _reference(image, 2))
+
+
+def test_import_does_not_load_cv2(monkeypatch):
+    monkeypatch.delitem(sys.modules, "cv2", raising=False)
+    monkeypatch.delitem(sys.modules, "senxor.proc")
+    monkeypatch.setattr(sys.modules["senxor"], "proc", proc)
+    importlib.import_module("senxor.proc")
+    assert "cv2" not in sys.modules
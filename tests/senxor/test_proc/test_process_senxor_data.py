@@ -0,0 +1,35 @@
+import re
+
+import numpy as np
+import pytest
+
+from senxor.consts import KELVIN, SENXOR_FRAME_SHAPE
+from senxor.proc import process_senxor_data
+
+
+def _unknown_size_message(nbytes: int) -> str:
+    message = f"Unknown senxor data size: {nbytes} bytes, please report this issue to the developer."
+    return f"^{re.escape(message)}$"
+
+
+class TestProcessSenxorData:
+    @pytest.mark.parametrize(("size", "shape"), list(SENXOR_FRAME_SHAPE.items()))
+    def test_frame_shape(self, size: int, shape: tuple[int, int]):
+        raw = np.arange(size, dtype=np.uint16) + 2900
+        frame = process_senxor_data(raw.tobytes())
+        assert frame.shape == shape
+        np.testing.assert_allclose(frame, np.round(raw / 10 - KELVIN, 1).reshape(shape))
+
+    @pytest.mark.parametrize(("size", "shape"), list(SENXOR_FRAME_SHAPE.items()))
+    def test_adc(self, size: int, shape: tuple[int, int]):
+        raw = np.arange(size, dtype=np.uint16)
+        frame = process_senxor_data(raw.tobytes(), adc=True)
+        assert frame.dtype == np.uint16
+        np.testing.assert_array_equal(frame, raw.reshape(shape))
+
+    def test_unknown_size(self):
+        with pytest.raises(ValueError, match=_unknown_size_message(200)):
+            process_senxor_data(bytes(200))
+        # An odd length is reported as is, not as a (possibly valid) pixel count
+        with pytest.raises(ValueError, match=_unknown_size_message(9921)):
+            process_senxor_data(bytes(4960 * 2 + 1))
@@ -1,5 +1,8 @@
 import pytest
 
+from senxor.consts import MCU_TYPE as MCU_TYPE_MAP
+from senxor.consts import MODULE_TYPE as MODULE_TYPE_MAP
+from senxor.consts import SENXOR_TYPE as SENXOR_TYPE_MAP
 from senxor.regmap.core import SenxorFieldsManager
 from tests.senxor.conftest import MockInterface
 
@@ -83,3 +86,64 @@ class TestField:
         # Test display property
         field.read()  # This should update field._value
         assert field.display == expected_display
+
+    def test_value_map_display(self, mock_fieldmap: SenxorFieldsManager):
+        fields = [field for field in mock_fieldmap if "value_map" in type(field).__dict__]
+        assert fields
+        for field in fields:
+            for value, display in field.value_map.items():  # type: ignore[reportAttributeAccessIssue]
+                assert field.get_display(value) == display
+            assert field.get_display(0xFF) == "Invalid value: 255"
+
+    def test_int8_display(self, mock_fieldmap: SenxorFieldsManager):
+        offset = mock_fieldmap.OFFSET
+        otf = mock_fieldmap.OTF
+        for uint8 in range(256):
+            int8 = uint8 if uint8 < 128 else uint8 - 256
+            assert offset.get_display(uint8) == round(int8 * 0.1, 1)
+            assert otf.get_display(uint8) == round(1 + int8 * 0.01, 2)
+        assert offset.get_display(249) == -0.7
+        assert otf.get_display(255) == 0.99
+
+    def test_frame_rate_divider_display(self, mock_fieldmap: SenxorFieldsManager):
+        field = mock_fieldmap.FRAME_RATE_DIVIDER
+        assert field.get_display(0) == "MAX FPS"
+        assert field.get_display(1) == "1/1 MAX FPS"
+        assert field.get_display(127) == "1/127 MAX FPS"
+        assert len(field._display_table) == field._max_value + 1  # type: ignore[reportAttributeAccessIssue]
+
+    def test_sleep_period_display(self, mock_fieldmap: SenxorFieldsManager, mock_interface: MockInterface):
+        field = mock_fieldmap.SLEEP_PERIOD
+        mock_interface.set_value(field.address, 0b00000101)
+        field.read()
+        assert field.display == "50 ms"
+        assert field.get_display(63) == "630 ms"
+
+        mock_interface.set_value(field.address, 0b01000101)
+        field.read()
+        assert field.display == "5 s"
+        assert field.get_display(0) == "0 s"
+
+    def test_display_out_of_table(self, mock_fieldmap: SenxorFieldsManager, mock_interface: MockInterface):
+        # Values outside the precomputed tables fall back to the display formulas
+        assert mock_fieldmap.FRAME_RATE_DIVIDER.get_display(200) == "1/200 MAX FPS"
+        assert mock_fieldmap.FRAME_RATE_DIVIDER.get_display(-1) == "1/-1 MAX FPS"
+        assert mock_fieldmap.OFFSET.get_display(-7) == -0.7
+        assert mock_fieldmap.OTF.get_display(-1) == 0.99
+        assert mock_fieldmap.OTF.get_display(256) == 1.0
+
+        mock_interface.set_value(mock_fieldmap.SLEEP_PERIOD.address, 0b01000000)
+        mock_fieldmap.SLEEP_PERIOD.read()
+        assert mock_fieldmap.SLEEP_PERIOD.get_display(100) == "100 s"
+        assert mock_fieldmap.SLEEP_PERIOD.get_display(-1) == "-1 s"
+
+    def test_type_display(self, mock_fieldmap: SenxorFieldsManager):
+        for name, type_map in (
+            ("SENXOR_TYPE", SENXOR_TYPE_MAP),
+            ("MODULE_TYPE", MODULE_TYPE_MAP),
+            ("MCU_TYPE", MCU_TYPE_MAP),
+        ):
+            field = mock_fieldmap.get_field(name)  # type: ignore[reportArgumentType]
+            for value, display in type_map.items():
+                assert field.get_display(value) == display
+            assert field.get_display(0x07) == "Unknown: 7"
@@ -28,6 +28,11 @@ class TestFields:
 
         assert not overlaps, "Field bit range overlaps detected:\n" + "\n".join(overlaps)
 
+    def test_writable_names(self):
+        assert Fields.__writable__ == {field.name for field in Fields.__fields__ if field.writable}
+        assert "EMISSIVITY" in Fields.__writable__
+        assert "FW_VERSION_MAJOR" not in Fields.__writable__
+
     def test_field_addresses_are_valid(self):
         """Ensure all field addresses are valid register addresses."""
         for field in Fields.__fields__:
@@ -65,3 +70,12 @@ class TestFields:
             reg: Register = getattr(Registers, reg_name)
             if field.self_reset:
                 assert reg.self_reset
+
+    def test_field_bit_layout(self):
+        """Ensure the precomputed bit layout matches the field's bits_range."""
+        for field in Fields.__fields__:
+            start_bit, end_bit = field.bits_range
+            assert field._shift == start_bit
+            assert field._mask == (1 << (end_bit - start_bit)) - 1
+            assert field._reg_mask == field._mask << start_bit
+            assert field._reg_mask <= 0xFF
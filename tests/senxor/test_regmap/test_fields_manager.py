@@ -1,11 +1,24 @@
 import pytest
 from structlog.testing import capture_logs
 
-from senxor.regmap.base import Field
+from senxor.regmap.base import Field, describe_field
 from senxor.regmap.core import SenxorFieldsManager, SenxorRegistersManager
 from tests.senxor.conftest import MockInterface
 
 
+def _make_field(fieldmap: SenxorFieldsManager, address: int, bits_range: tuple[int, int]) -> Field:
+    attrs = {
+        "name": "TEST_FIELD",
+        "help": "",
+        "address": address,
+        "bits_range": bits_range,
+        "writable": True,
+        "readable": True,
+        "self_reset": False,
+    }
+    return describe_field(type("TEST_FIELD", (Field,), attrs)).cls(fieldmap)
+
+
 class TestFieldsManager:
     def test_attributes(self, mock_fieldmap: SenxorFieldsManager):
         cache = mock_fieldmap.cache
@@ -39,6 +52,14 @@ class TestFieldsManager:
         assert 0x00 not in mock_fieldmap  # type: ignore[reportOperatorIssue]
         assert "INVALID_FIELD" not in mock_fieldmap
 
+    def test_field_attributes(self, mock_fieldmap: SenxorFieldsManager):
+        for name, field in mock_fieldmap.fields.items():
+            assert getattr(mock_fieldmap, name) is field
+
+        with pytest.raises(AttributeError):
+            mock_fieldmap.EMISSIVITY = 95  # type: ignore[reportAttributeAccessIssue]
+        assert mock_fieldmap.EMISSIVITY is mock_fieldmap.fields["EMISSIVITY"]
+
     def test_get_field(self, mock_fieldmap: SenxorFieldsManager):
         field = mock_fieldmap.get_field("SW_RESET")
         assert field.name == "SW_RESET"
@@ -76,6 +97,55 @@ class TestFieldsManager:
         with pytest.raises((KeyError, TypeError)):
             mock_fieldmap.read_field(114)  # type: ignore[reportArgumentType]
 
+    def test_read_field_refreshes_register_fields(
+        self,
+        mock_fieldmap: SenxorFieldsManager,
+        mock_interface: MockInterface,
+    ):
+        mock_interface.set_value(0xB1, 0b10011111)
+        assert mock_fieldmap.read_field("READOUT_MODE") == 7
+        fields = mock_fieldmap.get_fields_by_addr(0xB1)
+        assert [field._value for field in fields] == [1, 1, 7, 0, 1]
+
+    def test_read_fields(
+        self,
+        mock_fieldmap: SenxorFieldsManager,
+        mock_interface: MockInterface,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        mock_interface.set_value(0xB1, 0b10011111)
+        mock_interface.set_value(0xCA, 95)
+        reads: list[int] = []
+        batch_reads: list[list[int]] = []
+        read_reg = mock_interface.read_reg
+
+        def tracking_read_reg(reg: int) -> int:
+            reads.append(reg)
+            return read_reg(reg)
+
+        def read_regs(regs: list[int]) -> dict[int, int]:
+            batch_reads.append(list(regs))
+            return {reg: mock_interface.values[reg] for reg in regs}
+
+        monkeypatch.setattr(mock_interface, "read_reg", tracking_read_reg)
+        monkeypatch.setattr(mock_interface, "read_regs", read_regs)
+        names = ["READOUT_MODE", "EMISSIVITY", "ADC_ENABLE"]
+
+        # Registers are read one by one by default, each once
+        values = mock_fieldmap.read_fields(names)  # type: ignore[reportArgumentType]
+        assert values == {"READOUT_MODE": 7, "EMISSIVITY": 95, "ADC_ENABLE": 1}
+        assert reads == [0xB1, 0xCA]
+        assert batch_reads == []
+
+        mock_interface.set_value(0xCA, 96)
+        values = mock_fieldmap.read_fields(names, batch=True)  # type: ignore[reportArgumentType]
+        assert values == {"READOUT_MODE": 7, "EMISSIVITY": 96, "ADC_ENABLE": 1}
+        assert reads == [0xB1, 0xCA]
+        assert batch_reads == [[0xB1, 0xCA]]
+
+        with pytest.raises(KeyError):
+            mock_fieldmap.read_fields(["INVALID_FIELD"])  # type: ignore[reportArgumentType]
+
     def test_set_field(self, mock_fieldmap: SenxorFieldsManager, mock_interface: MockInterface):
         field_name = "EMISSIVITY"
         field = mock_fieldmap.get_field(field_name)
@@ -94,6 +164,85 @@ class TestFieldsManager:
         assert field.value == 96
         assert field.get() == 96
 
+    def test_set_full_register_field_skips_read(
+        self,
+        mock_fieldmap: SenxorFieldsManager,
+        mock_interface: MockInterface,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        def fail_read_reg(reg: int) -> int:
+            raise AssertionError(f"Unexpected read of register 0x{reg:02X}")
+
+        monkeypatch.setattr(mock_interface, "read_reg", fail_read_reg)
+        mock_fieldmap.set_field("EMISSIVITY", 95)
+        assert mock_interface.values[mock_fieldmap.EMISSIVITY.address] == 95
+        assert mock_fieldmap.EMISSIVITY._value == 95
+
+    def test_set_field_preserves_other_bits(self, mock_fieldmap: SenxorFieldsManager, mock_interface: MockInterface):
+        mock_interface.set_value(0xB1, 0b10000011)
+        mock_fieldmap.set_field("READOUT_MODE", 7)
+        assert mock_interface.values[0xB1] == 0b10011111
+
+    def test_set_fields(
+        self,
+        mock_fieldmap: SenxorFieldsManager,
+        mock_interface: MockInterface,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        mock_interface.set_value(0xB1, 0b10000011)
+        written: list[dict[int, int]] = []
+
+        def write_regs(regs: dict[int, int]) -> None:
+            written.append(dict(regs))
+            mock_interface.values.update(regs)
+
+        monkeypatch.setattr(mock_interface, "write_regs", write_regs)
+        mock_fieldmap.set_fields({"READOUT_MODE": 7, "GET_SINGLE_FRAME": 0, "EMISSIVITY": 95})
+        assert written == [{0xB1: 0b10011110, mock_fieldmap.EMISSIVITY.address: 95}]
+        assert mock_fieldmap.READOUT_MODE._value == 7
+        assert mock_fieldmap.GET_SINGLE_FRAME._value == 0
+        assert mock_fieldmap.ADC_ENABLE._value == 1
+
+        # Nothing is written if any value is invalid
+        with pytest.raises(ValueError):  # noqa: PT011
+            mock_fieldmap.set_fields({"EMISSIVITY": 96, "READOUT_MODE": 8})
+        with pytest.raises(AttributeError):
+            mock_fieldmap.set_fields({"EMISSIVITY": 96, "FW_VERSION_MAJOR": 2})
+        with pytest.raises(KeyError):
+            mock_fieldmap.set_fields({"EMISSIVITY": 96, "INVALID_FIELD": 2})  # type: ignore[reportArgumentType]
+        assert len(written) == 1
+
+    def test_set_fields_reads_uncached_registers_once(
+        self,
+        mock_fieldmap: SenxorFieldsManager,
+        mock_interface: MockInterface,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        mock_interface.set_value(0x20, 0b00000110)
+        mock_interface.set_value(0x30, 0b00000010)
+        reads: list[int] = []
+        read_reg = mock_interface.read_reg
+
+        def counting_read_reg(reg: int) -> int:
+            reads.append(reg)
+            return read_reg(reg)
+
+        def fail_read_regs(regs: list[int]) -> dict[int, int]:
+            raise AssertionError(f"Unexpected bulk read of registers {regs}")
+
+        monkeypatch.setattr(mock_interface, "read_reg", counting_read_reg)
+        monkeypatch.setattr(mock_interface, "read_regs", fail_read_regs)
+        mock_fieldmap.set_fields({"STARK_ENABLE": 1, "STARK_TYPE": 1, "MEDIAN_ENABLE": 1})
+        assert reads == [0x20, 0x30]
+        assert mock_interface.values[0x20] == 0b00000011
+        assert mock_interface.values[0x30] == 0b00000011
+
+        # Both registers are cached now
+        mock_fieldmap.set_fields({"STARK_ENABLE": 0, "MEDIAN_ENABLE": 0})
+        assert reads == [0x20, 0x30]
+        assert mock_interface.values[0x20] == 0b00000010
+        assert mock_interface.values[0x30] == 0b00000010
+
     def test_set_field_errors(self, mock_fieldmap: SenxorFieldsManager):
         # Test invalid field name
         with pytest.raises(KeyError):
@@ -260,9 +409,19 @@ class TestFieldsManager:
             (0b00001100, (2, 4), 3),
         ],
     )
-    def test_decode_field_value(self, reg_value: int, bits_range: tuple[int, int], expected: int):
-        result = SenxorFieldsManager._decode_field_value(reg_value, bits_range)
-        assert result == expected
+    def test_decode_field_value(
+        self,
+        mock_fieldmap: SenxorFieldsManager,
+        monkeypatch: pytest.MonkeyPatch,
+        reg_value: int,
+        bits_range: tuple[int, int],
+        expected: int,
+    ):
+        field = _make_field(mock_fieldmap, 0xCA, bits_range)
+        monkeypatch.setitem(mock_fieldmap._fields_by_addr, 0xCA, (field,))
+        updated_fields: dict[str, int] = {}
+        mock_fieldmap._decode_reg_fields(0xCA, reg_value, updated_fields)
+        assert field._value == expected
 
     @pytest.mark.parametrize(
         ("reg_value", "field_value", "bits_range", "expected"),
@@ -291,8 +450,21 @@ class TestFieldsManager:
             (0b00000000, 0b111, (5, 8), 0b11100000),  # unaligned 3-bit
         ],
     )
-    def test_encode_field_value(self, reg_value: int, field_value: int, bits_range: tuple[int, int], expected: int):
-        result = SenxorFieldsManager._encode_field_value(reg_value, field_value, bits_range)
+    def test_encode_field_value(
+        self,
+        mock_fieldmap: SenxorFieldsManager,
+        mock_interface: MockInterface,
+        monkeypatch: pytest.MonkeyPatch,
+        reg_value: int,
+        field_value: int,
+        bits_range: tuple[int, int],
+        expected: int,
+    ):
+        field = _make_field(mock_fieldmap, 0xCA, bits_range)
+        monkeypatch.setitem(mock_fieldmap.fields, field.name, field)
+        mock_interface.set_value(0xCA, reg_value)
+        mock_fieldmap.set_field(field.name, field_value)  # type: ignore[reportArgumentType]
+        result = mock_interface.values[0xCA]
         print(
             f"reg_value: {reg_value:08b}, field_value: {field_value:08b}, bits_range: {bits_range}, "
             f"expected: {expected:08b}, result: {result:08b}",
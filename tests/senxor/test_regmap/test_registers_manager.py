@@ -1,6 +1,7 @@
 import pytest
 from structlog.testing import capture_logs
 
+from senxor.interface.protocol import ISenxorInterface
 from senxor.regmap.base import Register
 from senxor.regmap.core import SenxorRegistersManager
 from tests.senxor.conftest import MockInterface
@@ -38,12 +39,35 @@ class TestRegistersManager:
         assert "INVALID_REGISTER" not in mock_regmap
         assert 0x999 not in mock_regmap
 
+    def test_register_attributes(self, mock_regmap: SenxorRegistersManager):
+        for reg in mock_regmap.registers.values():
+            assert getattr(mock_regmap, reg.name) is reg
+
+        with pytest.raises(AttributeError):
+            mock_regmap.EMISSIVITY = 95  # type: ignore[reportAttributeAccessIssue]
+        assert mock_regmap.EMISSIVITY is mock_regmap.get_reg("EMISSIVITY")
+
     def test_refresh_all(self, mock_regmap: SenxorRegistersManager, mock_interface: MockInterface):
         assert all(value is None for value in mock_regmap.cache.values())
         mock_interface.values = {addr: 1 for addr in mock_regmap.registers}
         mock_regmap.refresh_all()
         assert all(value == 1 for value in mock_regmap.cache.values())
 
+    def test_refresh_all_batch(
+        self,
+        mock_regmap: SenxorRegistersManager,
+        mock_interface: MockInterface,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        def fail_read_reg(reg: int) -> int:
+            raise AssertionError(f"Unexpected read of register 0x{reg:02X}")
+
+        monkeypatch.setattr(mock_interface, "read_reg", fail_read_reg)
+        mock_interface.values = {addr: 1 for addr in mock_regmap.registers}
+        mock_regmap.refresh_all(batch=True)
+        assert all(value == 1 for value in mock_regmap.cache.values())
+        assert mock_regmap.fieldmap.EMISSIVITY._value == 1
+
     def test_get_reg(self, mock_regmap: SenxorRegistersManager):
         reg = mock_regmap.get_reg("EMISSIVITY")
         assert reg.name == "EMISSIVITY"
@@ -102,6 +126,67 @@ class TestRegistersManager:
         # Test with invalid address
         with pytest.raises(ValueError):  # noqa: PT011
             mock_regmap.read_regs([0x100])  # type: ignore[reportArgumentType]
+        with pytest.raises(ValueError, match=r"\[256, -1\]"):
+            mock_regmap.read_regs([reg1.address, 0x100, -1])  # type: ignore[reportArgumentType]
+        with pytest.raises(TypeError):
+            mock_regmap.read_regs([reg1.address, "EMISSIVITY"])  # type: ignore[reportArgumentType]
+
+    def test_write_regs(self, mock_regmap: SenxorRegistersManager, mock_interface: MockInterface):
+        reg1 = mock_regmap.get_reg("EMISSIVITY")
+        reg2 = mock_regmap.get_reg("SENSITIVITY_FACTOR")
+
+        mock_regmap.write_regs({reg1.address: 95, reg2.address: 99})
+        assert mock_interface.values[reg1.address] == 95
+        assert mock_interface.values[reg2.address] == 99
+        assert reg1._value == 95
+        assert reg2._value == 99
+        assert mock_regmap.fieldmap.EMISSIVITY._value == 95
+        assert mock_regmap.fieldmap.CORR_FACTOR._value == 99
+
+        # Nothing is written if any register is read-only
+        fw_version_reg = mock_regmap.get_reg("FW_VERSION_1")
+        with pytest.raises(AttributeError):
+            mock_regmap.write_regs({reg1.address: 96, fw_version_reg.address: 2})
+        assert mock_interface.values[reg1.address] == 95
+        with pytest.raises(ValueError):  # noqa: PT011
+            mock_regmap.write_regs({reg1.address: 96, 0x100: 1})
+        assert mock_interface.values[reg1.address] == 95
+
+    def test_write_regs_without_interface_support(
+        self,
+        mock_regmap: SenxorRegistersManager,
+        mock_interface: MockInterface,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        emissivity = mock_regmap.EMISSIVITY.address
+        sensitivity = mock_regmap.SENSITIVITY_FACTOR.address
+        monkeypatch.setattr(MockInterface, "write_regs", ISenxorInterface.write_regs)
+        mock_regmap.write_regs({emissivity: 95, sensitivity: 99})
+        assert mock_interface.values[emissivity] == 95
+        assert mock_interface.values[sensitivity] == 99
+        assert mock_regmap.fieldmap.EMISSIVITY._value == 95
+
+    def test_write_regs_failure_clears_cache(
+        self,
+        mock_regmap: SenxorRegistersManager,
+        mock_interface: MockInterface,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        emissivity = mock_regmap.EMISSIVITY.address
+        sensitivity = mock_regmap.SENSITIVITY_FACTOR.address
+        mock_regmap.write_regs({emissivity: 95, sensitivity: 99})
+
+        def write_regs(regs: dict[int, int]) -> None:
+            mock_interface.values[emissivity] = regs[emissivity]
+            raise RuntimeError("write failed")
+
+        monkeypatch.setattr(mock_interface, "write_regs", write_regs)
+        with pytest.raises(RuntimeError):
+            mock_regmap.write_regs({emissivity: 96, sensitivity: 100})
+        assert mock_regmap.EMISSIVITY._value is None
+        assert mock_regmap.SENSITIVITY_FACTOR._value is None
+        assert mock_regmap.fieldmap.EMISSIVITY._value is None
+        assert mock_regmap.fieldmap.CORR_FACTOR._value is None
 
     def test_write_reg_errors(self, mock_regmap: SenxorRegistersManager):
         # Test invalid address type
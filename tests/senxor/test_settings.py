@@ -0,0 +1,38 @@
+import pytest
+from structlog.testing import capture_logs
+
+from senxor.core import Senxor
+from senxor.settings import SenxorSettings
+from tests.senxor.conftest import MockDevice, MockInterface
+
+
+class TestApplyProfile:
+    def test_settings_are_applied_in_order(self, monkeypatch: pytest.MonkeyPatch):
+        interface = MockInterface(MockDevice())  # pyright: ignore[reportAbstractUsage]
+        senxor = Senxor(interface, auto_open=False)
+        written: list[tuple[int, int]] = []
+        write_reg = interface.write_reg
+
+        def tracking_write_reg(reg: int, value: int) -> None:
+            written.append((reg, value))
+            write_reg(reg, value)
+
+        def fail_read_regs(regs: list[int]) -> dict[int, int]:
+            raise AssertionError(f"Unexpected bulk read of registers {regs}")
+
+        monkeypatch.setattr(interface, "write_reg", tracking_write_reg)
+        monkeypatch.setattr(interface, "read_regs", fail_read_regs)
+        SenxorSettings._apply_profile(senxor, {"STARK_ENABLE": 1, "REG_0x20": 0, "MEDIAN_ENABLE": 1})
+        assert written == [(0x20, 0b00000001), (0x20, 0), (0x30, 0b00000001)]
+        assert senxor.fields.STARK_ENABLE._value == 0
+
+    def test_failure_is_logged_with_key(self):
+        interface = MockInterface(MockDevice())  # pyright: ignore[reportAbstractUsage]
+        senxor = Senxor(interface, auto_open=False)
+        with capture_logs() as logs, pytest.raises(ValueError):  # noqa: PT011
+            SenxorSettings._apply_profile(senxor, {"EMISSIVITY": 95, "STARK_TYPE": 0xFF})
+        assert interface.values[0xCA] == 95
+        failed = [log for log in logs if log["event"] == "apply_profile_failed"]
+        assert len(failed) == 1
+        assert failed[0]["key"] == "STARK_TYPE"
+        assert failed[0]["value"] == 0xFF